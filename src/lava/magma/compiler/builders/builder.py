@@ -36,7 +36,7 @@ from lava.magma.core.model.py.ports import (
     PyVarPort
 )
 from lava.magma.compiler.channels.interfaces import AbstractCspPort, Channel, \
-    ChannelType
+    ChannelType, ChannelKind
 
 
 class PyProcessBuilder(AbstractProcessBuilder):
@@ -613,6 +613,7 @@ class RuntimeChannelBuilderMp(AbstractChannelBuilder):
     src_process: ty.Union[AbstractRuntimeServiceBuilder, ty.Type["Runtime"]]
     dst_process: ty.Union[AbstractRuntimeServiceBuilder, ty.Type["Runtime"]]
     port_initializer: PortInitializer
+    channel_kind: ChannelKind
 
     def build(self, messaging_infrastructure: MessageInfrastructureInterface) \
             -> Channel:
@@ -70,3 +70,10 @@ class ChannelType(IntEnum):
     PyPy = 0
     CPy = 1
     PyC = 2
+
+
+class ChannelKind(IntEnum):
+    """Direction of a management channel between the Runtime and a
+    RuntimeService"""
+    RUNTIME_TO_SERVICE = 1
+    SERVICE_TO_RUNTIME = 2
@@ -20,11 +20,48 @@ if ty.TYPE_CHECKING:
         .message_infrastructure_interface import MessageInfrastructureInterface
 
 
+_CACHE_LINE = 64
+"""Size in bytes of a cache line. Slots of a channel start on separate
+cache lines, so that the producer writing one slot and the consumer reading
+the previous one do not contend for the same line."""
+
+
 @dataclass
 class Proto:
     shape: np.ndarray
     dtype: np.dtype
     nbytes: int
+    stride: int
+
+
+def _slot_array(shm, proto, idx) -> np.ndarray:
+    """Returns an ndarray view of the slot with index idx of a channel's
+    shared memory."""
+    offset = proto.stride * idx
+    return np.ndarray(shape=proto.shape, dtype=proto.dtype,
+                      buffer=shm.buf[offset: offset + proto.nbytes])
+
+
+def _slot_buffer(shm, proto, size) -> np.ndarray:
+    """Returns a single ndarray view of all slots of a channel's shared
+    memory, with the slot index as first axis. Used to move a run of
+    consecutive tokens with one copy."""
+    token_strides = _slot_array(shm, proto, 0).strides
+    return np.ndarray(shape=(size,) + tuple(proto.shape), dtype=proto.dtype,
+                      buffer=shm.buf, strides=(proto.stride,) + token_strides)
+
+
+def _count_arrays(shm, proto, size) -> ty.Tuple[np.ndarray, np.ndarray]:
+    """Returns ndarray views of the two rings of token counts which follow
+    the slots in a channel's shared memory. Every release of the req (ack)
+    semaphore signals a run of consecutive tokens sent (received) at once,
+    whose length is written to the next entry of the first (second) ring.
+    As each run holds at least one token, no more than size runs are
+    outstanding in either direction."""
+    offset = proto.stride * size
+    counts = np.ndarray(shape=(2, size), dtype=np.int64,
+                        buffer=shm.buf[offset: offset + 2 * size * 8])
+    return counts[0], counts[1]
 
 
 class CspSendPort(AbstractCspSendPort):
@@ -49,13 +86,19 @@ class CspSendPort(AbstractCspSendPort):
         self._shm = shm
         self._shape = proto.shape
         self._dtype = proto.dtype
-        self._nbytes = proto.nbytes
+        self._proto = proto
         self._req = req
         self._ack = ack
         self._size = size
         self._idx = 0
         self._done = False
         self._array = []
+        self._buffer = None
+        self._req_counts = None
+        self._ack_counts = None
+        self._req_idx = 0
+        self._ack_idx = 0
+        self._registered = []
         self._semaphore = None
         self.observer = None
         self.thread = None
@@ -78,14 +121,11 @@ class CspSendPort(AbstractCspSendPort):
 
     def start(self):
         """Starts the port to listen on a thread"""
-        self._array = [
-            np.ndarray(
-                shape=self._shape,
-                dtype=self._dtype,
-                buffer=self._shm.buf[self._nbytes * i: self._nbytes * (i + 1)],
-            )
-            for i in range(self._size)
-        ]
+        self._array = [_slot_array(self._shm, self._proto, i)
+                       for i in range(self._size)]
+        self._buffer = _slot_buffer(self._shm, self._proto, self._size)
+        self._req_counts, self._ack_counts = _count_arrays(
+            self._shm, self._proto, self._size)
         self._semaphore = BoundedSemaphore(self._size)
         self.thread = Thread(
             target=self._ack_callback,
@@ -98,8 +138,13 @@ class CspSendPort(AbstractCspSendPort):
         try:
             while not self._done:
                 self._ack.acquire()
+                if self._done:
+                    break
+                count = int(self._ack_counts[self._ack_idx])
+                self._ack_idx = (self._ack_idx + 1) % self._size
                 not_full = self.probe()
-                self._semaphore.release()
+                for _ in range(count):
+                    self._semaphore.release()
                 if self.observer and not not_full:
                     self.observer()
         except EOFError:
@@ -124,10 +169,68 @@ class CspSendPort(AbstractCspSendPort):
         self._semaphore.acquire()
         self._array[self._idx][:] = data[:]
         self._idx = (self._idx + 1) % self._size
+        self._notify(1)
+
+    def _notify(self, count):
+        """Signals the receiver that count tokens have been sent."""
+        self._req_counts[self._req_idx] = count
+        self._req_idx = (self._req_idx + 1) % self._size
         self._req.release()
 
+    def register(self, data) -> int:
+        """
+        Register a token that is sent repeatedly. The token is validated and
+        copied once and can afterwards be sent by its handle using
+        send_registered. Returns the handle of the token.
+        """
+        if data.shape != self._shape:
+            raise AssertionError(f"{data.shape=} {self._shape=} Mismatch")
+        self._registered.append(np.array(data, dtype=self._dtype))
+        return len(self._registered) - 1
+
+    def send_registered(self, handle: int):
+        """
+        Send a token registered before on the channel. May block if the
+        channel is already full.
+        """
+        self._semaphore.acquire()
+        self._array[self._idx][:] = self._registered[handle]
+        self._idx = (self._idx + 1) % self._size
+        self._notify(1)
+
+    def send_batch(self, data):
+        """
+        Send a batch of tokens on the channel, one token per entry along the
+        first axis of data. Every run of tokens which fits into the free
+        slots is copied and signalled to the receiver at once. May block if
+        the channel is already full.
+        """
+        if data.shape[1:] != self._shape:
+            raise AssertionError(f"{data.shape[1:]=} {self._shape=} Mismatch")
+        num_tokens = data.shape[0]
+        sent = 0
+        while sent < num_tokens:
+            # Block for one free slot, then claim as many further free slots
+            # as are available up to the end of the shared memory buffer
+            self._semaphore.acquire()
+            count = 1
+            limit = min(num_tokens - sent, self._size - self._idx)
+            while count < limit and self._semaphore.acquire(blocking=False):
+                count += 1
+            # Copy the whole run of tokens into shared memory at once
+            self._buffer[self._idx:self._idx + count] = \
+                data[sent:sent + count]
+            self._idx = (self._idx + count) % self._size
+            sent += count
+            self._notify(count)
+
     def join(self):
+        """Stops the port and waits for its ack callback thread to exit"""
         self._done = True
+        if self.thread is not None:
+            # Wake up the callback thread blocked on the ack semaphore
+            self._ack.release()
+            self.thread.join()
 
 
 class CspRecvQueue(Queue):
@@ -163,6 +266,32 @@ class CspRecvQueue(Queue):
                 self.not_full.notify()
             return item
 
+    def put_many(self, num_items):
+        """
+        Appends num_items elements within a single critical section without
+        blocking. The caller ensures that the queue has room for them.
+        """
+        with self.not_full:
+            for _ in range(num_items):
+                self._put(0)
+            self.unfinished_tasks += num_items
+            self.not_empty.notify()
+
+    def get_many(self, max_items):
+        """
+        Blocks until the queue is not empty, then removes up to max_items
+        elements within a single critical section. Returns the number of
+        elements removed.
+        """
+        with self.not_empty:
+            while not self._qsize():
+                self.not_empty.wait()
+            count = min(max_items, self._qsize())
+            for _ in range(count):
+                self._get()
+            self.not_full.notify(count)
+            return count
+
 
 class CspRecvPort(AbstractCspRecvPort):
     """
@@ -186,13 +315,18 @@ class CspRecvPort(AbstractCspRecvPort):
         self._shm = shm
         self._shape = proto.shape
         self._dtype = proto.dtype
-        self._nbytes = proto.nbytes
+        self._proto = proto
         self._size = size
         self._req = req
         self._ack = ack
         self._idx = 0
         self._done = False
         self._array = []
+        self._buffer = None
+        self._req_counts = None
+        self._ack_counts = None
+        self._req_idx = 0
+        self._ack_idx = 0
         self._queue = None
         self.observer = None
         self.thread = None
@@ -215,14 +349,11 @@ class CspRecvPort(AbstractCspRecvPort):
 
     def start(self):
         """Starts the port to listen on a thread"""
-        self._array = [
-            np.ndarray(
-                shape=self._shape,
-                dtype=self._dtype,
-                buffer=self._shm.buf[self._nbytes * i: self._nbytes * (i + 1)],
-            )
-            for i in range(self._size)
-        ]
+        self._array = [_slot_array(self._shm, self._proto, i)
+                       for i in range(self._size)]
+        self._buffer = _slot_buffer(self._shm, self._proto, self._size)
+        self._req_counts, self._ack_counts = _count_arrays(
+            self._shm, self._proto, self._size)
         self._queue = CspRecvQueue(self._size)
         self.thread = Thread(
             target=self._req_callback,
@@ -235,8 +366,12 @@ class CspRecvPort(AbstractCspRecvPort):
         try:
             while not self._done:
                 self._req.acquire()
+                if self._done:
+                    break
+                count = int(self._req_counts[self._req_idx])
+                self._req_idx = (self._req_idx + 1) % self._size
                 not_empty = self.probe()
-                self._queue.put_nowait(0)
+                self._queue.put_many(count)
                 if self.observer and not not_empty:
                     self.observer()
         except EOFError:
@@ -245,9 +380,10 @@ class CspRecvPort(AbstractCspRecvPort):
     def probe(self):
         """
         Returns True if a 'recv' call will not block, and False otherwise.
-        Does not block.
+        Does not block. Reads the length of the underlying deque directly,
+        which is atomic, instead of taking the queue's lock.
         """
-        return self._queue.qsize() > 0
+        return len(self._queue.queue) > 0
 
     def peek(self):
         """
@@ -265,12 +401,64 @@ class CspRecvPort(AbstractCspRecvPort):
         self._queue.get()
         result = self._array[self._idx].copy()
         self._idx = (self._idx + 1) % self._size
+        self._acknowledge(1)
+
+        return result
+
+    def recv_scalar(self):
+        """
+        Receive from the channel and return the first element of the token
+        as a Python scalar, without copying the token. Blocks if there is no
+        data on the channel.
+        """
+        self._queue.get()
+        result = self._array[self._idx].item(0)
+        self._idx = (self._idx + 1) % self._size
+        self._acknowledge(1)
+
+        return result
+
+    def _acknowledge(self, count):
+        """Signals the sender that count tokens have been received."""
+        self._ack_counts[self._ack_idx] = count
+        self._ack_idx = (self._ack_idx + 1) % self._size
         self._ack.release()
 
+    def recv_batch(self, num_tokens, out=None):
+        """
+        Receive num_tokens tokens from the channel, stacked along the first
+        axis of the result. Every run of tokens available at once is copied
+        and acknowledged to the sender at once. Blocks until all tokens have
+        been received. If out is given, the tokens are written into its first
+        num_tokens entries instead of a newly allocated array.
+        """
+        if out is None:
+            result = np.empty((num_tokens,) + tuple(self._shape),
+                              dtype=self._dtype)
+        else:
+            result = out[:num_tokens]
+        received = 0
+        while received < num_tokens:
+            # Block for one token, then take as many further tokens as are
+            # available up to the end of the shared memory buffer
+            count = self._queue.get_many(
+                min(num_tokens - received, self._size - self._idx))
+            # Copy the whole run of tokens out of shared memory at once
+            result[received:received + count] = \
+                self._buffer[self._idx:self._idx + count]
+            self._idx = (self._idx + count) % self._size
+            received += count
+            self._acknowledge(count)
+
         return result
 
     def join(self):
+        """Stops the port and waits for its req callback thread to exit"""
         self._done = True
+        if self.thread is not None:
+            # Wake up the callback thread blocked on the req semaphore
+            self._req.release()
+            self.thread.join()
 
 
 class CspSelector:
@@ -300,6 +488,11 @@ class CspSelector:
         Wait for any channel to become ready, then execute the corresponding
         callable and return the result.
         """
+        # Fast path if a channel is ready already, without registering
+        # observers or taking the lock
+        for channel, action in args:
+            if channel.probe():
+                return action()
         with self._cv:
             self._set_observer(args, self._changed)
             while True:
@@ -332,12 +525,15 @@ class PyPyChannel(Channel):
         dtype : ty.Type[np.intc]
         size : int
         """
-        nbytes = np.prod(shape) * np.dtype(dtype).itemsize
+        nbytes = int(np.prod(shape) * np.dtype(dtype).itemsize)
+        # Round the slot size up to whole cache lines
+        stride = -(-nbytes // _CACHE_LINE) * _CACHE_LINE
         smm = message_infrastructure.smm
-        shm = smm.SharedMemory(int(nbytes * size))
+        # The slots are followed by the rings of token counts of runs
+        shm = smm.SharedMemory(stride * size + 2 * size * 8)
         req = Semaphore(0)
         ack = Semaphore(0)
-        proto = Proto(shape=shape, dtype=dtype, nbytes=nbytes)
+        proto = Proto(shape=shape, dtype=dtype, nbytes=nbytes, stride=stride)
         self._src_port = CspSendPort(src_name, shm, proto, size, req, ack)
         self._dst_port = CspRecvPort(dst_name, shm, proto, size, req, ack)
 
@@ -21,7 +21,7 @@ from lava.magma.compiler.builders.builder import PyProcessBuilder, \
     AbstractRuntimeServiceBuilder, RuntimeServiceBuilder, \
     AbstractChannelBuilder, ServiceChannelBuilderMp
 from lava.magma.compiler.builders.builder import RuntimeChannelBuilderMp
-from lava.magma.compiler.channels.interfaces import ChannelType
+from lava.magma.compiler.channels.interfaces import ChannelType, ChannelKind
 from lava.magma.compiler.executable import Executable
 from lava.magma.compiler.node import NodeConfig, Node
 from lava.magma.compiler.utils import VarInitializer, PortInitializer, \
@@ -717,7 +717,8 @@ class Compiler:
                                         rsb[sync_domain],
                                         self._create_mgmt_port_initializer(
                                             f"runtime_to_service_"
-                                            f"{sync_domain.name}"))
+                                            f"{sync_domain.name}"),
+                                        ChannelKind.RUNTIME_TO_SERVICE)
             sync_channel_builders.append(runtime_to_service)
 
             service_to_runtime = \
@@ -726,7 +727,8 @@ class Compiler:
                                         Runtime,
                                         self._create_mgmt_port_initializer(
                                             f"service_to_runtime_"
-                                            f"{sync_domain.name}"))
+                                            f"{sync_domain.name}"),
+                                        ChannelKind.SERVICE_TO_RUNTIME)
             sync_channel_builders.append(service_to_runtime)
 
             for process in sync_domain.processes:
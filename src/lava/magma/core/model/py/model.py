@@ -97,7 +97,7 @@ class AbstractPyProcessModel(AbstractProcessModel, ABC):
     def _get_var(self):
         """Handles the get Var command from runtime service."""
         # 1. Receive Var ID and retrieve the Var
-        var_id = int(self.service_to_process.recv()[0].item())
+        var_id = int(self.service_to_process.recv_scalar())
         var_name = self.var_id_to_var_map[var_id]
         var = getattr(self, var_name)
 
@@ -109,17 +109,14 @@ class AbstractPyProcessModel(AbstractProcessModel, ABC):
             data_port.send(enum_to_np(1))
             data_port.send(enum_to_np(var))
         elif isinstance(var, np.ndarray):
-            # FIXME: send a whole vector (also runtime_service.py)
-            var_iter = np.nditer(var)
-            num_items: np.integer = np.prod(var.shape)
+            num_items: int = var.size
             data_port.send(enum_to_np(num_items))
-            for value in var_iter:
-                data_port.send(enum_to_np(value, np.float64))
+            data_port.send_batch(var.reshape((-1, 1)))
 
     def _set_var(self):
         """Handles the set Var command from runtime service."""
         # 1. Receive Var ID and retrieve the Var
-        var_id = int(self.service_to_process.recv()[0].item())
+        var_id = int(self.service_to_process.recv_scalar())
         var_name = self.var_id_to_var_map[var_id]
         var = getattr(self, var_name)
 
@@ -137,14 +134,14 @@ class AbstractPyProcessModel(AbstractProcessModel, ABC):
             self.process_to_service.send(MGMT_RESPONSE.SET_COMPLETE)
         elif isinstance(var, np.ndarray):
             # First item is number of items
-            num_items = data_port.recv()[0]
-            var_iter = np.nditer(var, op_flags=['readwrite'])
-            # Set data one by one
-            for i in var_iter:
-                if num_items == 0:
-                    break
-                num_items -= 1
-                i[...] = data_port.recv()[0]
+            num_items = int(data_port.recv_scalar())
+            # Set data as a whole, receiving directly into the Var if its
+            # memory is contiguous. Items are cast to the Var's dtype while
+            # being copied out of the channel
+            if var.flags.c_contiguous:
+                data_port.recv_batch(num_items, out=var.reshape((-1, 1)))
+            else:
+                var.flat[:num_items] = data_port.recv_batch(num_items)[:, 0]
             self.process_to_service.send(MGMT_RESPONSE.SET_COMPLETE)
         else:
             self.process_to_service.send(MGMT_RESPONSE.ERROR)
@@ -6,3 +6,7 @@ from enum import IntEnum
 
 class ActorType(IntEnum):
     MultiProcessing = 0
+    MultiThreading = 1
+    Auto = 2
+    """Lets the Runtime choose between MultiProcessing and MultiThreading
+    depending on the size of the workload"""
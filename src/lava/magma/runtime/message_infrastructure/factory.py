@@ -4,6 +4,8 @@
 from lava.magma.core.process.message_interface_enum import ActorType
 from lava.magma.runtime.message_infrastructure.multiprocessing import \
     MultiProcessing
+from lava.magma.runtime.message_infrastructure.multithreading import \
+    MultiThreading
 
 """Factory class to create the messaging infrastructure"""
 
@@ -15,5 +17,7 @@ class MessageInfrastructureFactory:
         """type of actor framework being chosen"""
         if factory_type == ActorType.MultiProcessing:
             return MultiProcessing()
+        elif factory_type == ActorType.MultiThreading:
+            return MultiThreading()
         else:
             raise Exception("Unsupported factory_type")
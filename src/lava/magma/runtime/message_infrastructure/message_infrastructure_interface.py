@@ -39,6 +39,14 @@ class MessageInfrastructureInterface(ABC):
         """Given a target_fn starts a system process"""
         pass
 
+    def build_actors(self, target_fn: ty.Callable, builders: ty.Iterable[
+            ty.Union['PyProcessBuilder', 'AbstractRuntimeServiceBuilder']]):
+        """Given a target_fn starts a system process for every builder.
+        Implementations may override this to start the actors
+        concurrently."""
+        for builder in builders:
+            self.build_actor(target_fn=target_fn, builder=builder)
+
     @property
     @abstractmethod
     def actors(self) -> ty.List[ty.Any]:
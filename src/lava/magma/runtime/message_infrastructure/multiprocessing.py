@@ -9,6 +9,7 @@ if ty.TYPE_CHECKING:
 
 import multiprocessing as mp
 import os
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing.managers import SharedMemoryManager
 import traceback
 
@@ -82,6 +83,26 @@ class MultiProcessing(MessageInfrastructureInterface):
         self._actors.append(system_process)
         return system_process
 
+    def build_actors(self, target_fn: ty.Callable, builders: ty.Iterable[
+            ty.Union['PyProcessBuilder', 'AbstractRuntimeServiceBuilder']]):
+        """Given a target_fn starts a system (os) process for every builder.
+        Unless processes are forked, starting a process launches and
+        initializes a new interpreter, so the processes are started
+        concurrently. Forking is cheap but not safe from multiple threads,
+        hence forked processes are started one after the other."""
+        system_processes = [SystemProcess(target=target_fn,
+                                          args=(),
+                                          kwargs={"builder": builder})
+                            for builder in builders]
+        self._actors.extend(system_processes)
+        if mp.get_start_method() == "fork" or len(system_processes) < 2:
+            for system_process in system_processes:
+                system_process.start()
+        else:
+            with ThreadPoolExecutor(
+                    max_workers=min(32, len(system_processes))) as pool:
+                list(pool.map(SystemProcess.start, system_processes))
+
     def stop(self):
         """Stops the shared memory manager"""
         for actor in self._actors:
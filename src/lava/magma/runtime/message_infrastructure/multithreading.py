@@ -0,0 +1,96 @@
+# Copyright (C) 2021 Intel Corporation
+# SPDX-License-Identifier: BSD-3-Clause
+# See: https://spdx.org/licenses/
+import typing as ty
+if ty.TYPE_CHECKING:
+    from lava.magma.core.process.process import AbstractProcess
+    from lava.magma.compiler.builders.builder import PyProcessBuilder, \
+        AbstractRuntimeServiceBuilder
+
+import threading
+from multiprocessing.managers import SharedMemoryManager
+import traceback
+
+from lava.magma.compiler.channels.interfaces import ChannelType, Channel
+from lava.magma.compiler.channels.pypychannel import PyPyChannel
+
+from lava.magma.core.sync.domain import SyncDomain
+from lava.magma.runtime.message_infrastructure.message_infrastructure_interface\
+    import MessageInfrastructureInterface
+
+
+"""Implements the Message Infrastructure Interface using Python threads.
+Each actor runs as a thread of the current process, which avoids the cost of
+spawning an OS process per actor and is therefore suited to small or
+short-running workloads. As all actors share one interpreter they do not
+execute in parallel. The Channel Infrastructure is the same shared memory
+based implementation as for the MultiProcessing infrastructure."""
+
+
+class SystemThread(threading.Thread):
+    """Wraps a thread so that the exceptions can be collected if present"""
+    def __init__(self, *args, **kwargs):
+        threading.Thread.__init__(self, *args, **kwargs)
+        self._exception = None
+
+    def run(self):
+        try:
+            threading.Thread.run(self)
+        except Exception as e:
+            tb = traceback.format_exc()
+            self._exception = (e, tb)
+
+    @property
+    def exception(self):
+        return self._exception
+
+
+class MultiThreading(MessageInfrastructureInterface):
+    """Implements message passing using shared memory and threads"""
+
+    def __init__(self):
+        self._smm: ty.Optional[SharedMemoryManager] = None
+        self._actors: ty.List[SystemThread] = []
+
+    @property
+    def actors(self):
+        """Returns a list of actors"""
+        return self._actors
+
+    @property
+    def smm(self):
+        """Returns the underlying shared memory manager"""
+        return self._smm
+
+    def start(self):
+        """Starts the shared memory manager"""
+        self._smm = SharedMemoryManager()
+        self._smm.start()
+
+    def build_actor(self, target_fn: ty.Callable, builder: ty.Union[
+        ty.Dict['AbstractProcess', 'PyProcessBuilder'], ty.Dict[
+            SyncDomain, 'AbstractRuntimeServiceBuilder']]) -> ty.Any:
+        """Given a target_fn starts a system thread"""
+        system_thread = SystemThread(target=target_fn,
+                                     args=(),
+                                     kwargs={"builder": builder},
+                                     daemon=True)
+        system_thread.start()
+        self._actors.append(system_thread)
+        return system_thread
+
+    def stop(self):
+        """Stops the shared memory manager"""
+        for actor in self._actors:
+            if actor is not threading.current_thread():
+                actor.join()
+
+        self._smm.shutdown()
+
+    def channel_class(self, channel_type: ChannelType) -> ty.Type[Channel]:
+        """Given a channel type, returns the shared memory based class
+        implementation for the same"""
+        if channel_type == ChannelType.PyPy:
+            return PyPyChannel
+        else:
+            raise Exception(f"Unsupported channel type {channel_type}")
@@ -3,13 +3,18 @@
 # See: https://spdx.org/licenses/
 from __future__ import annotations
 
+import os
 import sys
 import typing
 import typing as ty
+import warnings
+from functools import partial
+from itertools import chain
 
 import numpy as np
 
-from lava.magma.compiler.channels.pypychannel import CspSendPort, CspRecvPort
+from lava.magma.compiler.channels.pypychannel import CspSendPort, \
+    CspRecvPort, CspSelector
 from lava.magma.compiler.exec_var import AbstractExecVar
 from lava.magma.core.process.message_interface_enum import ActorType
 from lava.magma.runtime.message_infrastructure.factory import \
@@ -26,7 +31,7 @@ if ty.TYPE_CHECKING:
 from lava.magma.compiler.builders.builder import AbstractProcessBuilder, \
     RuntimeChannelBuilderMp, ServiceChannelBuilderMp, \
     RuntimeServiceBuilder
-from lava.magma.compiler.channels.interfaces import Channel
+from lava.magma.compiler.channels.interfaces import Channel, ChannelKind
 from lava.magma.core.resources import HeadNode
 from lava.magma.core.run_conditions import RunSteps, RunContinuous
 from lava.magma.compiler.executable import Executable
@@ -100,6 +105,8 @@ class Runtime:
         self._run_cond: typing.Optional[AbstractRunCondition] = None
         self._executable: Executable = exe
 
+        if message_infrastructure_type == ActorType.Auto:
+            message_infrastructure_type = self._select_actor_type()
         self._messaging_infrastructure_type: ActorType = \
             message_infrastructure_type
         self._messaging_infrastructure: \
@@ -109,14 +116,69 @@ class Runtime:
         self._is_started: bool = False
         self._req_paused: bool = False
         self._req_stop: bool = False
+        self._run_resp_handlers: ty.Dict[float, ty.Callable] = {
+            MGMT_RESPONSE.DONE[0]: self._on_run_done,
+            MGMT_RESPONSE.REQ_PAUSE[0]: self._on_req_pause,
+            MGMT_RESPONSE.REQ_STOP[0]: self._on_req_stop,
+            MGMT_RESPONSE.ERROR[0]: self._on_run_error
+        }
         self.runtime_to_service: ty.Iterable[CspSendPort] = []
         self.service_to_runtime: ty.Iterable[CspRecvPort] = []
+        self._rts_send_fns: ty.Tuple[ty.Callable, ...] = ()
+        self._str_recv_fns: ty.Tuple[ty.Callable, ...] = ()
+        self._rts_send_pause_fns: ty.Tuple[ty.Callable, ...] = ()
+        self._rts_send_stop_fns: ty.Tuple[ty.Callable, ...] = ()
+        self._selector: CspSelector = CspSelector()
+        self._exec_vars: ty.Dict[int, AbstractExecVar] = {}
+        self._rs_by_srv_id: ty.Dict[int, RuntimeServiceBuilder] = {}
+        self._process_builders: ty.Dict[
+            "AbstractProcess", "AbstractProcessBuilder"] = {}
+        # Scratch token reused for every scalar sent to RuntimeServices
+        self._scalar_token: np.ndarray = enum_to_np(0)
+
+    def _select_actor_type(self) -> ActorType:
+        """Selects the actor type for ActorType.Auto. Small workloads run
+        their actors as threads, since spawning an OS process per actor
+        dominates their run time, larger workloads use OS processes to
+        execute in parallel."""
+        num_actors = sum(len(builders) for builders in
+                         [self._executable.py_builders,
+                          self._executable.c_builders,
+                          self._executable.nc_builders,
+                          self._executable.rs_builders] if builders)
+        if num_actors <= (os.cpu_count() or 1) // 2:
+            return ActorType.MultiThreading
+        return ActorType.MultiProcessing
+
+    def __enter__(self):
+        """Initializes the runtime if needed so that it can be used as a
+        context manager which stops it again on exit."""
+        if not self._is_initialized:
+            self.initialize()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stops the runtime and its actors if it was initialized."""
+        if self._is_started:
+            self.stop()
+        elif self._is_initialized:
+            # The RuntimeServices of a runtime which was never started wait
+            # for a command, hence they are sent STOP before the messaging
+            # infrastructure joins them
+            try:
+                self._terminate_services()
+            finally:
+                self._release_infrastructure()
 
     def __del__(self):
         """On destruction, terminate Runtime automatically to
-        free compute resources.
+        free compute resources. This is only a fallback, a started Runtime
+        should be stopped explicitly or used as a context manager.
         """
         if self._is_started:
+            warnings.warn("Runtime was not stopped before destruction. Call "
+                          "stop() or use the Runtime as a context manager.",
+                          ResourceWarning)
             self.stop()
 
     def initialize(self):
@@ -135,14 +197,68 @@ class Runtime:
         if node_config[0].node_type != HeadNode:
             raise AssertionError
 
+        self._exec_vars = node_config.exec_vars
+        if self._executable.rs_builders:
+            self._rs_by_srv_id = {rs.runtime_service_id: rs for rs in
+                                  self._executable.rs_builders.values()}
+
         self._build_message_infrastructure()
+        self._build_process_builder_lookup()
         self._build_channels()
         self._build_sync_channels()
-        self._build_processes()
-        self._build_runtime_services()
+        self._build_actors()
         self._start_ports()
+        self._freeze_ports()
         self._is_initialized = True
 
+    def _send_scalar(self, send_port: CspSendPort,
+                     value: ty.Union[int, float]):
+        """Sends a scalar value as a single token on send_port. The value
+        is written into a preallocated scratch token as send copies it into
+        the channel anyway."""
+        self._scalar_token[0] = value
+        send_port.send(self._scalar_token)
+
+    def _freeze_ports(self):
+        """Freezes the ports to the RuntimeServices once all sync channels
+        are built and caches their bound send/recv methods so that the
+        broadcast and gather loops avoid per-port attribute lookups."""
+        self.runtime_to_service = tuple(self.runtime_to_service)
+        self.service_to_runtime = tuple(self.service_to_runtime)
+        self._rts_send_fns = tuple(p.send for p in self.runtime_to_service)
+        self._str_recv_fns = tuple(p.recv for p in self.service_to_runtime)
+        # Register the commands sent on every pause and stop once per port
+        # and bind each port's handle to its send_registered method
+        self._rts_send_pause_fns = tuple(
+            partial(p.send_registered, p.register(MGMT_COMMAND.PAUSE))
+            for p in self.runtime_to_service)
+        self._rts_send_stop_fns = tuple(
+            partial(p.send_registered, p.register(MGMT_COMMAND.STOP))
+            for p in self.runtime_to_service)
+
+    def _fan_out(self, send_fns: ty.Tuple[ty.Callable, ...], *args):
+        """Calls every send function with args."""
+        for send in send_fns:
+            send(*args)
+
+    def _broadcast(self, token: np.ndarray):
+        """Sends token to all RuntimeServices."""
+        self._fan_out(self._rts_send_fns, token)
+
+    def _gather(self) -> ty.Iterator[np.ndarray]:
+        """Yields one response from every RuntimeService in the order in
+        which the responses arrive, so that a slow RuntimeService does not
+        hold up handling the responses already sent by the others."""
+        if len(self._str_recv_fns) == 1:
+            yield self._str_recv_fns[0]()
+            return
+        pending = dict(enumerate(self.service_to_runtime))
+        while pending:
+            idx = self._selector.select(
+                *[(port, lambda i=i: i) for i, port in pending.items()])
+            del pending[idx]
+            yield self._str_recv_fns[idx]()
+
     def _start_ports(self):
         """Start the ports of the runtime to communicate with runtime
         services"""
@@ -164,6 +280,13 @@ class Runtime:
             self._messaging_infrastructure_type)
         self._messaging_infrastructure.start()
 
+    def _build_process_builder_lookup(self):
+        """Merges the process builders of all ProcessModel types into a
+        single lookup table used while wiring up the channels"""
+        self._process_builders = {**(self._executable.c_builders or {}),
+                                  **(self._executable.py_builders or {}),
+                                  **(self._executable.nc_builders or {})}
+
     def _get_process_builder_for_process(self, process):
         """
         Given a process return its process builder
@@ -171,13 +294,7 @@ class Runtime:
         :param process: AbstractProcess
         :return: AbstractProcessBuilder
         """
-        process_builders: ty.Dict[
-            "AbstractProcess", "AbstractProcessBuilder"
-        ] = {}
-        process_builders.update(self._executable.c_builders)
-        process_builders.update(self._executable.py_builders)
-        process_builders.update(self._executable.nc_builders)
-        return process_builders[process]
+        return self._process_builders[process]
 
     def _build_channels(self):
         """Given the channel builders for an executable,
@@ -197,6 +314,13 @@ class Runtime:
     def _build_sync_channels(self):
         """Builds the channels needed for synchronization between runtime
         components"""
+        # Keeps the Runtime's end of each kind of runtime channel
+        keep_runtime_port = {
+            ChannelKind.RUNTIME_TO_SERVICE:
+                lambda ch: self.runtime_to_service.append(ch.src_port),
+            ChannelKind.SERVICE_TO_RUNTIME:
+                lambda ch: self.service_to_runtime.append(ch.dst_port),
+        }
         if self._executable.sync_channel_builders:
             for sync_channel_builder in self._executable.sync_channel_builders:
                 channel: Channel = sync_channel_builder.build(
@@ -210,11 +334,8 @@ class Runtime:
                     else:
                         sync_channel_builder.dst_process.set_csp_ports(
                             [channel.dst_port])
-                    # TODO: Get rid of if/else ladder
-                    if "runtime_to_service" in channel.src_port.name:
-                        self.runtime_to_service.append(channel.src_port)
-                    elif "service_to_runtime" in channel.src_port.name:
-                        self.service_to_runtime.append(channel.dst_port)
+                    keep_runtime_port[sync_channel_builder.channel_kind](
+                        channel)
                 elif isinstance(sync_channel_builder, ServiceChannelBuilderMp):
                     if isinstance(sync_channel_builder.src_process,
                                   RuntimeServiceBuilder):
@@ -234,60 +355,71 @@ class Runtime:
 
     # ToDo: (AW) Why not pass the builder as an argument to the mp.Process
     #  constructor which will then be passed to the target function?
-    def _build_processes(self):
-        """Builds the process for all process builders within an executable"""
-        process_builders_collection: ty.List[
-            ty.Dict[AbstractProcess, AbstractProcessBuilder]] = [
-            self._executable.py_builders,
-            self._executable.c_builders,
-            self._executable.nc_builders,
-        ]
-
-        for process_builders in process_builders_collection:
-            if process_builders:
-                for proc, proc_builder in process_builders.items():
-                    # Assign current Runtime to process
-                    proc._runtime = self
-                    self._messaging_infrastructure.build_actor(
-                        target_fn=target_fn,
-                        builder=proc_builder)
-
-    def _build_runtime_services(self):
-        """Builds the runtime services"""
-        runtime_service_builders = self._executable.rs_builders
+    def _build_actors(self):
+        """Builds the processes for all process builders and the runtime
+        services within an executable. All builders are handed to the
+        message infrastructure at once, so it may start the actors
+        concurrently."""
+        process_builders = chain.from_iterable(
+            builders.items() for builders in (self._executable.py_builders,
+                                              self._executable.c_builders,
+                                              self._executable.nc_builders)
+            if builders)
+        builders = []
+        for proc, proc_builder in process_builders:
+            # Assign current Runtime to process
+            proc._runtime = self
+            builders.append(proc_builder)
         if self._executable.rs_builders:
-            for sd, rs_builder in runtime_service_builders.items():
-                self._messaging_infrastructure.build_actor(
-                    target_fn=target_fn,
-                    builder=rs_builder)
+            builders.extend(self._executable.rs_builders.values())
+        self._messaging_infrastructure.build_actors(target_fn=target_fn,
+                                                    builders=builders)
+
+    def _collect_actor_errors(self) -> int:
+        """Waits for all actors to terminate and prints the traceback of
+        every exception raised within an actor.
+
+        :return: Number of exceptions raised by the actors
+        """
+        actors = self._messaging_infrastructure.actors
+        for actor in actors:
+            actor.join()
+        exceptions = [exception for exception in
+                      (actor.exception for actor in actors) if exception]
+        for _, traceback in exceptions:
+            print(traceback)
+        return len(exceptions)
+
+    def _on_run_done(self):
+        """Response handler for a RuntimeService that finished a run."""
+        pass
+
+    def _on_req_pause(self):
+        """Response handler for a pause requested by a ProcessModel."""
+        self._req_paused = True
+
+    def _on_req_stop(self):
+        """Response handler for a stop requested by a ProcessModel."""
+        self._req_stop = True
+
+    def _on_run_error(self):
+        """Response handler for an error raised within a ProcessModel."""
+        # Receive all errors from the ProcessModels
+        error_cnt = self._collect_actor_errors()
+        raise RuntimeError(
+            f"{error_cnt} Exception(s) occurred. See "
+            f"output above for details.")
 
     def _get_resp_for_run(self):
         """
         Gets response from RuntimeServices
         """
         if self._is_running:
-            for recv_port in self.service_to_runtime:
-                data = recv_port.recv()
-                if enum_equal(data, MGMT_RESPONSE.REQ_PAUSE):
-                    self._req_paused = True
-                elif enum_equal(data, MGMT_RESPONSE.REQ_STOP):
-                    self._req_stop = True
-                elif not enum_equal(data, MGMT_RESPONSE.DONE):
-                    if enum_equal(data, MGMT_RESPONSE.ERROR):
-                        # Receive all errors from the ProcessModels
-                        error_cnt = 0
-                        for actors in \
-                                self._messaging_infrastructure.actors:
-                            actors.join()
-                            if actors.exception:
-                                _, traceback = actors.exception
-                                print(traceback)
-                                error_cnt += 1
-                        raise RuntimeError(
-                            f"{error_cnt} Exception(s) occurred. See "
-                            f"output above for details.")
-                    else:
-                        raise RuntimeError(f"Runtime Received {data}")
+            for data in self._gather():
+                handler = self._run_resp_handlers.get(data[0])
+                if handler is None:
+                    raise RuntimeError(f"Runtime Received {data}")
+                handler()
             if self._req_paused:
                 self._req_paused = False
                 self.pause()
@@ -321,14 +453,14 @@ class Runtime:
             self._is_running = True
             if isinstance(run_condition, RunSteps):
                 self.num_steps = run_condition.num_steps
-                for send_port in self.runtime_to_service:
-                    send_port.send(enum_to_np(self.num_steps))
+                self._scalar_token[0] = self.num_steps
+                self._broadcast(self._scalar_token)
                 if run_condition.blocking:
                     self._get_resp_for_run()
             elif isinstance(run_condition, RunContinuous):
                 self.num_steps = sys.maxsize
-                for send_port in self.runtime_to_service:
-                    send_port.send(enum_to_np(self.num_steps))
+                self._scalar_token[0] = self.num_steps
+                self._broadcast(self._scalar_token)
             else:
                 raise ValueError(f"Wrong type of run_condition : "
                                  f"{run_condition.__class__}")
@@ -343,21 +475,12 @@ class Runtime:
     def pause(self):
         """Pauses the execution"""
         if self._is_running:
-            for send_port in self.runtime_to_service:
-                send_port.send(MGMT_COMMAND.PAUSE)
-            for recv_port in self.service_to_runtime:
-                data = recv_port.recv()
+            self._fan_out(self._rts_send_pause_fns)
+            for data in self._gather():
                 if not enum_equal(data, MGMT_RESPONSE.PAUSED):
                     if enum_equal(data, MGMT_RESPONSE.ERROR):
                         # Receive all errors from the ProcessModels
-                        error_cnt = 0
-                        for actors in \
-                                self._messaging_infrastructure.actors:
-                            actors.join()
-                            if actors.exception:
-                                _, traceback = actors.exception
-                                print(traceback)
-                                error_cnt += 1
+                        error_cnt = self._collect_actor_errors()
                         self.stop()
                         raise RuntimeError(
                             f"{error_cnt} Exception(s) occurred. See "
@@ -368,20 +491,36 @@ class Runtime:
         """Stops an ongoing or paused run."""
         try:
             if self._is_started:
-                for send_port in self.runtime_to_service:
-                    send_port.send(MGMT_COMMAND.STOP)
-                for recv_port in self.service_to_runtime:
-                    data = recv_port.recv()
-                    if not enum_equal(data, MGMT_RESPONSE.TERMINATED):
-                        raise RuntimeError(f"Runtime Received {data}")
-                self.join()
+                self._terminate_services()
                 self._is_running = False
                 self._is_started = False
                 # Send messages to RuntimeServices to stop as soon as possible.
             else:
                 print("Runtime not started yet.")
         finally:
-            self._messaging_infrastructure.stop()
+            self._release_infrastructure()
+
+    def _terminate_services(self):
+        """Sends STOP to all RuntimeServices and waits until they have
+        terminated together with their ProcessModels."""
+        self._fan_out(self._rts_send_stop_fns)
+        for data in self._gather():
+            if not enum_equal(data, MGMT_RESPONSE.TERMINATED):
+                raise RuntimeError(f"Runtime Received {data}")
+        self.join()
+
+    def _release_infrastructure(self):
+        """Stops the messaging infrastructure, which joins all actors, and
+        drops the frozen ports so that the runtime can be initialized
+        again."""
+        self._messaging_infrastructure.stop()
+        self.runtime_to_service = []
+        self.service_to_runtime = []
+        self._rts_send_fns = ()
+        self._str_recv_fns = ()
+        self._rts_send_pause_fns = ()
+        self._rts_send_stop_fns = ()
+        self._is_initialized = False
 
     def join(self):
         """Join all ports and processes"""
@@ -395,13 +534,12 @@ class Runtime:
         if self._is_running:
             print("WARNING: Cannot Set a Var when the execution is going on")
             return
-        node_config: NodeConfig = self._executable.node_configs[0]
-        ev: AbstractExecVar = node_config.exec_vars[var_id]
+        ev: AbstractExecVar = self._exec_vars[var_id]
         runtime_srv_id: int = ev.runtime_srv_id
         model_id: int = ev.process.id
 
-        if issubclass(list(self._executable.rs_builders.values())
-                      [runtime_srv_id].rs_class, AsyncPyRuntimeService):
+        rs_class = self._rs_by_srv_id[runtime_srv_id].rs_class
+        if issubclass(rs_class, AsyncPyRuntimeService):
             raise RuntimeError("Set is not supported in AsyncPyRuntimeService")
 
         if self._is_started:
@@ -411,24 +549,22 @@ class Runtime:
             # 1. Send SET Command
             req_port: CspSendPort = self.runtime_to_service[runtime_srv_id]
             req_port.send(MGMT_COMMAND.SET_DATA)
-            req_port.send(enum_to_np(model_id))
-            req_port.send(enum_to_np(var_id))
+            self._send_scalar(req_port, model_id)
+            self._send_scalar(req_port, var_id)
 
             rsp_port: CspRecvPort = self.service_to_runtime[runtime_srv_id]
 
-            # 2. Reshape the data
+            # 2. Reshape the data into one token per item
             buffer: np.ndarray = value
             if idx:
                 buffer = buffer[idx]
-            buffer_shape: ty.Tuple[int, ...] = buffer.shape
-            num_items: int = np.prod(buffer_shape).item()
-            buffer = buffer.reshape((1, num_items))
+            num_items: int = buffer.size
+            buffer = buffer.reshape((num_items, 1))
 
             # 3. Send [NUM_ITEMS, DATA1, DATA2, ...]
             data_port: CspSendPort = self.runtime_to_service[runtime_srv_id]
-            data_port.send(enum_to_np(num_items))
-            for i in range(num_items):
-                data_port.send(enum_to_np(buffer[0, i], np.float64))
+            self._send_scalar(data_port, num_items)
+            data_port.send_batch(buffer)
             rsp = rsp_port.recv()
             if not enum_equal(rsp, MGMT_RESPONSE.SET_COMPLETE):
                 raise RuntimeError("Var Set couldn't get successfully "
@@ -441,14 +577,11 @@ class Runtime:
         if self._is_running:
             print("WARNING: Cannot Get a Var when the execution is going on")
             return
-        node_config: NodeConfig = self._executable.node_configs[0]
-        ev: AbstractExecVar = node_config.exec_vars[var_id]
+        ev: AbstractExecVar = self._exec_vars[var_id]
         runtime_srv_id: int = ev.runtime_srv_id
         model_id: int = ev.process.id
 
-        rs_builders = list(self._executable.rs_builders.values())
-        rs_class = [rs for rs in rs_builders
-                    if rs.runtime_service_id == runtime_srv_id][0].rs_class
+        rs_class = self._rs_by_srv_id[runtime_srv_id].rs_class
         if issubclass(rs_class, AsyncPyRuntimeService):
             raise RuntimeError("Get is not supported in AsyncPyRuntimeService")
 
@@ -459,15 +592,13 @@ class Runtime:
             # 1. Send GET Command
             req_port: CspSendPort = self.runtime_to_service[runtime_srv_id]
             req_port.send(MGMT_COMMAND.GET_DATA)
-            req_port.send(enum_to_np(model_id))
-            req_port.send(enum_to_np(var_id))
+            self._send_scalar(req_port, model_id)
+            self._send_scalar(req_port, var_id)
 
             # 2. Receive Data [NUM_ITEMS, DATA1, DATA2, ...]
             data_port: CspRecvPort = self.service_to_runtime[runtime_srv_id]
-            num_items: int = int(data_port.recv()[0].item())
-            buffer: np.ndarray = np.empty((1, num_items))
-            for i in range(num_items):
-                buffer[0, i] = data_port.recv()[0]
+            num_items: int = int(data_port.recv_scalar())
+            buffer: np.ndarray = data_port.recv_batch(num_items)
 
             # 3. Reshape result and return
             buffer = buffer.reshape(ev.shape)
@@ -3,6 +3,7 @@
 # See: https://spdx.org/licenses/
 import typing as ty
 from abc import ABC, abstractmethod
+from functools import partial
 
 import numpy as np
 
@@ -54,6 +55,10 @@ class AbstractRuntimeService(ABC):
         self.service_to_runtime: ty.Optional[CspSendPort] = None
 
         self.model_ids: ty.List[int] = []
+        self._model_idx: ty.Dict[int, int] = {}
+        self._pm_send_fns: ty.Tuple[ty.Callable, ...] = ()
+        self._pm_recv_fns: ty.Tuple[ty.Callable, ...] = ()
+        self._relay_buf: ty.Optional[np.ndarray] = None
 
         self.service_to_process: ty.Iterable[CspSendPort] = []
         self.process_to_service: ty.Iterable[CspRecvPort] = []
@@ -66,11 +71,23 @@ class AbstractRuntimeService(ABC):
     def start(self):
         """Start the necessary channels to coordinate with runtime and group
         of processes this RuntimeService is managing"""
+        # Index of each ProcessModel's ports by its model id
+        self._model_idx = {mid: i for i, mid in enumerate(self.model_ids)}
+        self.service_to_process = tuple(self.service_to_process)
+        self.process_to_service = tuple(self.process_to_service)
+        self._pm_send_fns = tuple(p.send for p in self.service_to_process)
+        self._pm_recv_fns = tuple(p.recv for p in self.process_to_service)
+        # Scratch buffer relaying one channel's capacity of Var data. All
+        # management channels share the token type of runtime_to_service
+        rts = self.runtime_to_service
+        self._relay_buf = np.empty((rts.size,) + tuple(rts.shape),
+                                   dtype=rts.d_type)
         self.runtime_to_service.start()
         self.service_to_runtime.start()
-        for i in range(len(self.service_to_process)):
-            self.service_to_process[i].start()
-            self.process_to_service[i].start()
+        for stop_port, ptos_port in zip(self.service_to_process,
+                                        self.process_to_service):
+            stop_port.start()
+            ptos_port.start()
         self.run()
 
     @abstractmethod
@@ -86,9 +103,10 @@ class AbstractRuntimeService(ABC):
         self.runtime_to_service.join()
         self.service_to_runtime.join()
 
-        for i in range(len(self.service_to_process)):
-            self.service_to_process[i].join()
-            self.process_to_service[i].join()
+        for stop_port, ptos_port in zip(self.service_to_process,
+                                        self.process_to_service):
+            stop_port.join()
+            ptos_port.join()
 
 
 class PyRuntimeService(AbstractRuntimeService):
@@ -104,13 +122,11 @@ class LoihiPyRuntimeService(PyRuntimeService):
 
     def __init__(self, protocol):
         super().__init__(protocol)
-        self.req_pre_lrn_mgmt = False
-        self.req_post_lrn_mgmt = False
-        self.req_lrn = False
-        self.req_stop = False
-        self.req_pause = False
+        self._req_bits = 0
         self.paused = False
         self._error = False
+        self._pm_recv_scalar_fns: ty.Tuple[ty.Callable, ...] = ()
+        self._pm_cmd_senders: ty.Dict[float, ty.Tuple[ty.Callable, ...]] = {}
 
     class Phase:
         SPK = enum_to_np(1)
@@ -139,26 +155,53 @@ class LoihiPyRuntimeService(PyRuntimeService):
         REQ_STOP = enum_to_np(-8)
         """Signifies Request of STOP"""
 
+    # Bits of pending requests of ProcessModels, lower bits take priority
+    _REQ_PRE_LRN_MGMT = 1 << 0
+    _REQ_POST_LRN_MGMT = 1 << 1
+    _REQ_LRN = 1 << 2
+    _REQ_PAUSE = 1 << 3
+    _REQ_STOP = 1 << 4
+    # Phase to advance to, indexed by the bit_length of the lowest pending
+    # request bit
+    _PHASE_BY_BIT = (None, Phase.PRE_MGMT, Phase.POST_MGMT, Phase.LRN,
+                     MGMT_COMMAND.PAUSE, MGMT_COMMAND.STOP)
+    # Request bit set by each ProcessModel response requesting a phase
+    _REQ_BIT_BY_RESP = {
+        PMResponse.REQ_PRE_LRN_MGMT.item(): _REQ_PRE_LRN_MGMT,
+        PMResponse.REQ_POST_LRN_MGMT.item(): _REQ_POST_LRN_MGMT,
+        PMResponse.REQ_LEARNING.item(): _REQ_LRN,
+        PMResponse.REQ_PAUSE.item(): _REQ_PAUSE,
+        PMResponse.REQ_STOP.item(): _REQ_STOP,
+    }
+    _STATUS_DONE = PMResponse.STATUS_DONE.item()
+    _STATUS_ERROR = PMResponse.STATUS_ERROR.item()
+
+    def start(self):
+        """Registers the commands sent to all ProcessModels with their
+        ports, then starts the RuntimeService"""
+        self._pm_recv_scalar_fns = tuple(
+            p.recv_scalar for p in self.process_to_service)
+        phase = LoihiPyRuntimeService.Phase
+        cmds = (phase.SPK, phase.PRE_MGMT, phase.LRN, phase.POST_MGMT,
+                phase.HOST, MGMT_COMMAND.STOP, MGMT_COMMAND.PAUSE)
+        # For every command, bind each port's handle of the registered
+        # command to its send_registered method
+        self._pm_cmd_senders = {
+            cmd.item(): tuple(partial(p.send_registered, p.register(cmd))
+                              for p in self.service_to_process)
+            for cmd in cmds}
+        super().start()
+
     def _next_phase(self, is_last_time_step: bool):
         """Advances the current phase to the next phase.
         On the first time step it starts with HOST phase and advances to SPK.
         Afterwards it loops: SPK -> PRE_MGMT -> LRN -> POST_MGMT -> SPK
         On the last time step POST_MGMT advances to HOST phase."""
-        if self.req_pre_lrn_mgmt:
-            self.req_pre_lrn_mgmt = False
-            return LoihiPyRuntimeService.Phase.PRE_MGMT
-        if self.req_post_lrn_mgmt:
-            self.req_post_lrn_mgmt = False
-            return LoihiPyRuntimeService.Phase.POST_MGMT
-        if self.req_lrn:
-            self.req_lrn = False
-            return LoihiPyRuntimeService.Phase.LRN
-        if self.req_pause:
-            self.req_pause = False
-            return MGMT_COMMAND.PAUSE
-        if self.req_stop:
-            self.req_stop = False
-            return MGMT_COMMAND.STOP
+        req_bits = self._req_bits
+        if req_bits:
+            # Serve the pending request of highest priority and clear it
+            self._req_bits = req_bits & (req_bits - 1)
+            return self._PHASE_BY_BIT[(req_bits & -req_bits).bit_length()]
 
         if is_last_time_step:
             return LoihiPyRuntimeService.Phase.HOST
@@ -166,82 +209,94 @@ class LoihiPyRuntimeService(PyRuntimeService):
 
     def _send_pm_cmd(self, phase: MGMT_COMMAND):
         """Sends a command (phase information) to all ProcessModels."""
-        for send_port in self.service_to_process:
-            send_port.send(phase)
+        senders = self._pm_cmd_senders.get(phase.item(0))
+        if senders is None:
+            for send in self._pm_send_fns:
+                send(phase)
+        else:
+            for send_registered in senders:
+                send_registered()
 
     def _send_pm_req_given_model_id(self, model_id: int, *requests):
         """Sends requests to a ProcessModel given by the model id."""
-        process_idx = self.model_ids.index(model_id)
+        process_idx = self._model_idx[model_id]
         req_port = self.service_to_process[process_idx]
         for request in requests:
             req_port.send(request)
 
-    def _get_pm_resp(self) -> ty.Iterable[MGMT_RESPONSE]:
-        """Retrieves responses of all ProcessModels."""
-        rcv_msgs = []
-        num_responses_expected = len(self.model_ids)
-        counter = 0
-        while counter < num_responses_expected:
-            ptos_recv_port = self.process_to_service[counter]
-            rcv_msgs.append(ptos_recv_port.recv())
-            counter += 1
+    def _get_pm_resp(self) -> ty.List[float]:
+        """Retrieves responses of all ProcessModels as Python scalars."""
+        rcv_msgs = [recv() for recv in self._pm_recv_scalar_fns]
+        status_done = self._STATUS_DONE
         for idx, recv_msg in enumerate(rcv_msgs):
-            if enum_equal(recv_msg,
-                          LoihiPyRuntimeService.PMResponse.STATUS_ERROR):
-                self._error = True
-            if enum_equal(recv_msg,
-                          LoihiPyRuntimeService.PMResponse.REQ_PRE_LRN_MGMT):
-                self.req_pre_lrn_mgmt = True
-            if enum_equal(recv_msg,
-                          LoihiPyRuntimeService.PMResponse.REQ_POST_LRN_MGMT):
-                self.req_post_lrn_mgmt = True
-            if enum_equal(recv_msg,
-                          LoihiPyRuntimeService.PMResponse.REQ_LEARNING):
-                self.req_lrn = True
-            if enum_equal(recv_msg,
-                          LoihiPyRuntimeService.PMResponse.REQ_PAUSE):
-                # ToDo: Add some mechanism to get the exact process id
-                print(f"Process : {idx} has requested Pause")
-                self.req_pause = True
-            if enum_equal(recv_msg,
-                          LoihiPyRuntimeService.PMResponse.REQ_STOP):
-                # ToDo: Add some mechanism to get the exact process id
-                print(f"Process : {idx} has requested Stop")
-                self.req_stop = True
+            if recv_msg != status_done:
+                self._handle_pm_resp(idx, recv_msg)
         return rcv_msgs
 
+    def _handle_pm_resp(self, idx: int, recv_msg: float):
+        """Records an error or a request for another phase from the
+        ProcessModel with index idx."""
+        if recv_msg == self._STATUS_ERROR:
+            self._error = True
+        req_bit = self._REQ_BIT_BY_RESP.get(recv_msg, 0)
+        if req_bit == self._REQ_PAUSE:
+            # ToDo: Add some mechanism to get the exact process id
+            print(f"Process : {idx} has requested Pause")
+        elif req_bit == self._REQ_STOP:
+            # ToDo: Add some mechanism to get the exact process id
+            print(f"Process : {idx} has requested Stop")
+        self._req_bits |= req_bit
+
+    def _relay_num_items(self, recv_port: CspRecvPort,
+                         send_port: CspSendPort) -> int:
+        """Relays the token holding the number of items of a Var from
+        recv_port to send_port through the scratch buffer and returns the
+        number of items."""
+        header = self._relay_buf[:1]
+        recv_port.recv_batch(1, out=header)
+        send_port.send_batch(header)
+        return int(header.item(0))
+
+    def _relay_batch(self, recv_port: CspRecvPort, send_port: CspSendPort,
+                     num_items: int):
+        """Relays num_items tokens from recv_port to send_port in chunks of
+        at most one channel's capacity, so that the receiver can consume a
+        chunk while the next one is relayed. The chunks pass through a
+        scratch buffer allocated once in start."""
+        relay_buf = self._relay_buf
+        chunk = relay_buf.shape[0]
+        for start in range(0, num_items, chunk):
+            count = min(chunk, num_items - start)
+            recv_port.recv_batch(count, out=relay_buf)
+            send_port.send_batch(relay_buf[:count])
+
     def _relay_to_runtime_data_given_model_id(self, model_id: int):
         """Relays data received from ProcessModel given by model id  to the
         runtime"""
-        process_idx = self.model_ids.index(model_id)
+        process_idx = self._model_idx[model_id]
         data_recv_port = self.process_to_service[process_idx]
         data_relay_port = self.service_to_runtime
-        num_items = data_recv_port.recv()
-        data_relay_port.send(num_items)
-        for i in range(int(num_items[0])):
-            value = data_recv_port.recv()
-            data_relay_port.send(value)
+        num_items = self._relay_num_items(data_recv_port, data_relay_port)
+        self._relay_batch(data_recv_port, data_relay_port, num_items)
 
     def _relay_to_pm_data_given_model_id(self, model_id: int) -> MGMT_RESPONSE:
         """Relays data received from the runtime to the ProcessModel given by
         the model id."""
-        process_idx = self.model_ids.index(model_id)
+        process_idx = self._model_idx[model_id]
         data_recv_port = self.runtime_to_service
         data_relay_port = self.service_to_process[process_idx]
         resp_port = self.process_to_service[process_idx]
         # Receive and relay number of items
-        num_items = data_recv_port.recv()
-        data_relay_port.send(num_items)
+        num_items = self._relay_num_items(data_recv_port, data_relay_port)
         # Receive and relay data1, data2, ...
-        for i in range(int(num_items[0].item())):
-            data_relay_port.send(data_recv_port.recv())
+        self._relay_batch(data_recv_port, data_relay_port, num_items)
         rsp = resp_port.recv()
         return rsp
 
     def _relay_pm_ack_given_model_id(self, model_id: int):
         """Relays ack received from ProcessModel given by model id to the
         runtime."""
-        process_idx = self.model_ids.index(model_id)
+        process_idx = self._model_idx[model_id]
 
         ack_recv_port = self.process_to_service[process_idx]
         ack_relay_port = self.service_to_runtime
@@ -250,23 +305,20 @@ class LoihiPyRuntimeService(PyRuntimeService):
     def _handle_pause(self):
         # Inform all ProcessModels about the PAUSE command
         self._send_pm_cmd(MGMT_COMMAND.PAUSE)
-        rsps = self._get_pm_resp()
-        for rsp in rsps:
-            if not enum_equal(rsp,
-                              LoihiPyRuntimeService.PMResponse.STATUS_PAUSED):
-                raise ValueError(f"Wrong Response Received : {rsp}")
+        rsps = np.array(self._get_pm_resp())
+        wrong = rsps != LoihiPyRuntimeService.PMResponse.STATUS_PAUSED
+        if wrong.any():
+            raise ValueError(f"Wrong Response Received : {rsps[wrong]}")
         # Inform the runtime about successful pausing
         self.service_to_runtime.send(MGMT_RESPONSE.PAUSED)
 
     def _handle_stop(self):
         # Inform all ProcessModels about the STOP command
         self._send_pm_cmd(MGMT_COMMAND.STOP)
-        rsps = self._get_pm_resp()
-        for rsp in rsps:
-            if not enum_equal(rsp,
-                              LoihiPyRuntimeService.PMResponse.STATUS_TERMINATED
-                              ):
-                raise ValueError(f"Wrong Response Received : {rsp}")
+        rsps = np.array(self._get_pm_resp())
+        wrong = rsps != LoihiPyRuntimeService.PMResponse.STATUS_TERMINATED
+        if wrong.any():
+            raise ValueError(f"Wrong Response Received : {rsps[wrong]}")
         # Inform the runtime about successful termination
         self.service_to_runtime.send(MGMT_RESPONSE.TERMINATED)
         self.join()
@@ -283,88 +335,99 @@ class LoihiPyRuntimeService(PyRuntimeService):
 
         channel_actions = [(self.runtime_to_service, lambda: 'cmd')]
 
+        # Bind constants and methods used in every phase to locals once.
+        # Received tokens are unwrapped once, so that constants are compared
+        # as plain Python scalars
+        phase_spk = LoihiPyRuntimeService.Phase.SPK.item()
+        phase_host = LoihiPyRuntimeService.Phase.HOST.item()
+        cmd_stop = MGMT_COMMAND.STOP.item()
+        cmd_pause = MGMT_COMMAND.PAUSE.item()
+        cmd_get_data = MGMT_COMMAND.GET_DATA.item()
+        cmd_set_data = MGMT_COMMAND.SET_DATA.item()
+        next_phase = self._next_phase
+        send_pm_cmd = self._send_pm_cmd
+        get_pm_resp = self._get_pm_resp
+        send_to_runtime = self.service_to_runtime.send
+        probe_runtime = self.runtime_to_service.probe
+
         while True:
             # Probe if there is a new command from the runtime
             action = selector.select(*channel_actions)
             if action == 'cmd':
                 command = self.runtime_to_service.recv()
-                if enum_equal(command, MGMT_COMMAND.STOP):
+                cmd = command.item(0)
+                if cmd == cmd_stop:
                     self._handle_stop()
                     return
-                elif enum_equal(command, MGMT_COMMAND.PAUSE):
+                elif cmd == cmd_pause:
                     self._handle_pause()
                     self.paused = True
-                elif enum_equal(command, MGMT_COMMAND.GET_DATA) or \
-                        enum_equal(command, MGMT_COMMAND.SET_DATA):
+                elif cmd == cmd_get_data or cmd == cmd_set_data:
                     self._handle_get_set(phase, command)
                 else:
                     self.paused = False
                     # The number of time steps was received ("command")
                     # Start iterating through Loihi phases
+                    num_steps = int(cmd)
                     curr_time_step = 0
                     phase = LoihiPyRuntimeService.Phase.HOST
                     while True:
-                        # Check if it is the last time step
-                        is_last_ts = enum_equal(enum_to_np(curr_time_step),
-                                                command)
-                        # Advance to the next phase
-                        phase = self._next_phase(is_last_ts)
-                        if enum_equal(phase, MGMT_COMMAND.STOP):
-                            self.service_to_runtime.send(MGMT_RESPONSE.REQ_STOP)
+                        # Advance to the next phase, which is HOST after
+                        # the last time step
+                        phase = next_phase(curr_time_step == num_steps)
+                        phase_id = phase.item(0)
+                        if phase_id == cmd_stop:
+                            send_to_runtime(MGMT_RESPONSE.REQ_STOP)
                             break
-                        if enum_equal(phase, MGMT_COMMAND.PAUSE):
-                            self.service_to_runtime.send(
-                                MGMT_RESPONSE.REQ_PAUSE)
+                        if phase_id == cmd_pause:
+                            send_to_runtime(MGMT_RESPONSE.REQ_PAUSE)
                             break
                         # Increase time step if spiking phase
-                        if enum_equal(phase, LoihiPyRuntimeService.Phase.SPK):
+                        if phase_id == phase_spk:
                             curr_time_step += 1
                         # Inform ProcessModels about current phase
-                        self._send_pm_cmd(phase)
+                        send_pm_cmd(phase)
                         # ProcessModels respond with DONE if not HOST phase
-                        if not enum_equal(
-                                phase, LoihiPyRuntimeService.Phase.HOST):
-                            self._get_pm_resp()
+                        if phase_id != phase_host:
+                            get_pm_resp()
                             if self._error:
                                 # Forward error to runtime
-                                self.service_to_runtime.send(
-                                    MGMT_RESPONSE.ERROR)
+                                send_to_runtime(MGMT_RESPONSE.ERROR)
                                 # stop all other pm
-                                self._send_pm_cmd(MGMT_COMMAND.STOP)
+                                send_pm_cmd(MGMT_COMMAND.STOP)
                                 return
                         # Check if pause or stop received from Runtime
                         # TODO: Do we actualy need to wait for PMs to be in
                         # HOST or MGMT phase to stop or pause them?
-                        if self.runtime_to_service.probe():
-                            cmd = self.runtime_to_service.peek()
-                            if enum_equal(cmd, MGMT_COMMAND.STOP):
+                        if probe_runtime():
+                            cmd = self.runtime_to_service.peek().item(0)
+                            if cmd == cmd_stop:
                                 self.runtime_to_service.recv()
                                 self._handle_stop()
                                 return
-                            if enum_equal(cmd, MGMT_COMMAND.PAUSE):
+                            if cmd == cmd_pause:
                                 self.runtime_to_service.recv()
                                 self._handle_pause()
                                 self.paused = True
                                 break
 
                         # If HOST phase (last time step ended) break the loop
-                        if enum_equal(
-                                phase, LoihiPyRuntimeService.Phase.HOST):
+                        if phase_id == phase_host:
                             break
-                    if self.paused or enum_equal(phase, MGMT_COMMAND.STOP) or \
-                            enum_equal(phase, MGMT_COMMAND.PAUSE):
+                    if self.paused or phase_id == cmd_stop or \
+                            phase_id == cmd_pause:
                         continue
                     # Inform the runtime that last time step was reached
-                    self.service_to_runtime.send(MGMT_RESPONSE.DONE)
+                    send_to_runtime(MGMT_RESPONSE.DONE)
             else:
-                self.service_to_runtime.send(MGMT_RESPONSE.ERROR)
+                send_to_runtime(MGMT_RESPONSE.ERROR)
 
     def _handle_get_set(self, phase, command):
         if enum_equal(phase, LoihiPyRuntimeService.Phase.HOST):
             if enum_equal(command, MGMT_COMMAND.GET_DATA):
                 requests: ty.List[np.ndarray] = [command]
                 # recv model_id
-                model_id: int = int(self.runtime_to_service.recv()[0].item())
+                model_id: int = int(self.runtime_to_service.recv_scalar())
                 # recv var_id
                 requests.append(self.runtime_to_service.recv())
                 self._send_pm_req_given_model_id(model_id, *requests)
@@ -372,7 +435,7 @@ class LoihiPyRuntimeService(PyRuntimeService):
             elif enum_equal(command, MGMT_COMMAND.SET_DATA):
                 requests: ty.List[np.ndarray] = [command]
                 # recv model_id
-                model_id: int = int(self.runtime_to_service.recv()[0].item())
+                model_id: int = int(self.runtime_to_service.recv_scalar())
                 # recv var_id
                 requests.append(self.runtime_to_service.recv())
                 self._send_pm_req_given_model_id(model_id, *requests)
@@ -411,14 +474,11 @@ class AsyncPyRuntimeService(PyRuntimeService):
         """Signifies Request of STOP"""
 
     def _send_pm_cmd(self, cmd: MGMT_COMMAND):
-        for stop_send_port in self.service_to_process:
-            stop_send_port.send(cmd)
+        for send in self._pm_send_fns:
+            send(cmd)
 
     def _get_pm_resp(self) -> ty.Iterable[MGMT_RESPONSE]:
-        rcv_msgs = []
-        for ptos_recv_port in self.process_to_service:
-            rcv_msgs.append(ptos_recv_port.recv())
-        return rcv_msgs
+        return [recv() for recv in self._pm_recv_fns]
 
     def _handle_pause(self):
         # Inform the runtime about successful pausing
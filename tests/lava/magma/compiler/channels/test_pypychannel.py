@@ -76,6 +76,45 @@ class TestPyPyChannelSingleProcess(unittest.TestCase):
         finally:
             smm.shutdown()
 
+    def test_send_recv_batch_single_process(self):
+        smm = SharedMemoryManager()
+        try:
+            smm.start()
+
+            data = np.arange(12, dtype=np.float64).reshape((6, 2))
+            channel = get_channel(smm, data[0], size=4)
+
+            channel.src_port.start()
+            channel.dst_port.start()
+
+            # Batches wrap around the end of the channel buffer
+            for batch in (data[:3], data[3:]):
+                channel.src_port.send_batch(batch)
+                result = channel.dst_port.recv_batch(len(batch))
+                assert np.array_equal(result, batch)
+        finally:
+            smm.shutdown()
+
+    def test_send_registered_single_process(self):
+        smm = SharedMemoryManager()
+        try:
+            smm.start()
+
+            data = np.array([1, 2, 3], dtype=np.int32)
+            channel = get_channel(smm, data, size=2)
+            handle = channel.src_port.register(data)
+
+            channel.src_port.start()
+            channel.dst_port.start()
+
+            # Later modifications do not affect the registered token
+            data[0] = 7
+            channel.src_port.send_registered(handle)
+            result = channel.dst_port.recv()
+            assert np.array_equal(result, np.array([1, 2, 3]))
+        finally:
+            smm.shutdown()
+
 
 class DummyProcess(Process):
     """Wrapper around multiprocessing.Process to start channels"""
@@ -121,6 +160,15 @@ def buffer(shape, dst_port, src_port):
             src_port.send(msg)
 
 
+def batch_source(data, port):
+    port.send_batch(data)
+
+
+def batch_sink(data, port):
+    result = port.recv_batch(len(data))
+    assert np.array_equal(result, data), f"Mismatch {result=} {data=}"
+
+
 class TestPyPyChannelMultiProcess(unittest.TestCase):
     def test_send_recv_relay(self):
         smm = SharedMemoryManager()
@@ -171,6 +219,33 @@ class TestPyPyChannelMultiProcess(unittest.TestCase):
         finally:
             smm.shutdown()
 
+    def test_send_recv_batch_larger_than_channel(self):
+        smm = SharedMemoryManager()
+        try:
+            smm.start()
+            data = np.arange(50, dtype=np.float64).reshape((25, 2))
+            channel = get_channel(smm, data[0], size=4)
+
+            jobs = [
+                DummyProcess(
+                    ports=(channel.src_port,),
+                    target=batch_source,
+                    args=(data, channel.src_port),
+                ),
+                DummyProcess(
+                    ports=(channel.dst_port,),
+                    target=batch_sink,
+                    args=(data, channel.dst_port),
+                ),
+            ]
+            for p in jobs:
+                p.start()
+            for p in jobs:
+                p.join()
+                self.assertEqual(p.exitcode, 0)
+        finally:
+            smm.shutdown()
+
 
 if __name__ == "__main__":
     unittest.main()
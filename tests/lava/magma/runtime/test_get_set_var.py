@@ -3,11 +3,13 @@
 # See: https://spdx.org/licenses/
 
 import numpy as np
+import threading
 import unittest
 
 from lava.magma.core.decorator import implements, requires
 from lava.magma.core.model.py.model import PyLoihiProcessModel
 from lava.magma.core.model.py.type import LavaPyType
+from lava.magma.core.process.message_interface_enum import ActorType
 from lava.magma.core.process.process import AbstractProcess
 from lava.magma.core.process.variable import Var
 from lava.magma.core.resources import CPU
@@ -15,6 +17,7 @@ from lava.magma.core.run_conditions import RunSteps
 from lava.magma.core.run_configs import RunConfig
 from lava.magma.core.sync.domain import SyncDomain
 from lava.magma.core.sync.protocols.loihi_protocol import LoihiProtocol
+from lava.magma.runtime.runtime import Runtime
 
 
 class SimpleProcess(AbstractProcess):
@@ -27,6 +30,14 @@ class SimpleProcess(AbstractProcess):
                                                 dtype=np.float64))
 
 
+class LargeProcess(AbstractProcess):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        shape = kwargs["shape"]
+        self.u = Var(shape=shape, init=np.arange(np.prod(shape),
+                                                 dtype=np.int32).reshape(shape))
+
+
 class SimpleRunConfig(RunConfig):
     def __init__(self, **kwargs):
         sync_domains = kwargs.pop("sync_domains")
@@ -50,6 +61,12 @@ class SimpleProcessModel(PyLoihiProcessModel):
     v = LavaPyType(np.ndarray, np.float64, precision=32)
 
 
+@implements(proc=LargeProcess, protocol=LoihiProtocol)
+@requires(CPU)
+class LargeProcessModel(PyLoihiProcessModel):
+    u = LavaPyType(np.ndarray, np.int32, precision=32)
+
+
 class TestGetSetVar(unittest.TestCase):
     def test_get_set_var_using_runtime(self):
         """Checks that get_var() method of the runtime retrieves expected
@@ -144,6 +161,83 @@ class TestGetSetVar(unittest.TestCase):
         assert np.array_equal(process.u.get(), expected_result_u)
         process.stop()
 
+    def test_get_set_var_using_threads(self):
+        """Checks get_var() and set_var() when the actors run as threads
+        instead of OS processes."""
+        process = SimpleProcess(shape=(2, 2))
+        simple_sync_domain = SyncDomain("simple", LoihiProtocol(), [process])
+        run_config = SimpleRunConfig(sync_domains=[simple_sync_domain])
+        executable = process.compile(run_config)
+        with Runtime(executable, ActorType.MultiThreading) as runtime:
+            runtime.start(RunSteps(num_steps=10))
+            expected_result_u = np.array([[7, 8], [9, 10]], dtype=np.int32)
+            assert np.array_equal(runtime.get_var(process.u.id),
+                                  expected_result_u)
+            expected_result_u *= 10
+            runtime.set_var(process.u.id, expected_result_u)
+            runtime.start(RunSteps(num_steps=5))
+            assert np.array_equal(runtime.get_var(process.u.id),
+                                  expected_result_u)
+
+    def test_threads_terminate_on_stop(self):
+        """Checks that stopping a runtime whose actors run as threads also
+        terminates the callback threads of all channel ports."""
+        process = SimpleProcess(shape=(2, 2))
+        simple_sync_domain = SyncDomain("simple", LoihiProtocol(), [process])
+        run_config = SimpleRunConfig(sync_domains=[simple_sync_domain])
+        executable = process.compile(run_config)
+        num_threads = threading.active_count()
+        runtime = Runtime(executable, ActorType.MultiThreading)
+        runtime.initialize()
+        runtime.start(RunSteps(num_steps=5))
+        self.assertGreater(threading.active_count(), num_threads)
+        runtime.stop()
+        self.assertEqual(threading.active_count(), num_threads)
+
+    def test_runtime_context_manager_without_start(self):
+        """Checks that leaving the context of a runtime which was never
+        started terminates all actors."""
+        process = SimpleProcess(shape=(2, 2))
+        simple_sync_domain = SyncDomain("simple", LoihiProtocol(), [process])
+        run_config = SimpleRunConfig(sync_domains=[simple_sync_domain])
+        executable = process.compile(run_config)
+        with Runtime(executable, ActorType.MultiProcessing) as runtime:
+            actors = runtime._messaging_infrastructure.actors
+            self.assertTrue(all(actor.is_alive() for actor in actors))
+        self.assertFalse(any(actor.is_alive() for actor in actors))
+
+    def test_runtime_initialize_after_context_manager(self):
+        """Checks that a runtime can be initialized and run again after
+        leaving its context."""
+        process = SimpleProcess(shape=(2, 2))
+        simple_sync_domain = SyncDomain("simple", LoihiProtocol(), [process])
+        run_config = SimpleRunConfig(sync_domains=[simple_sync_domain])
+        executable = process.compile(run_config)
+        runtime = Runtime(executable, ActorType.MultiProcessing)
+        with runtime:
+            runtime.start(RunSteps(num_steps=2))
+        with runtime:
+            runtime.start(RunSteps(num_steps=2))
+            expected_result_u = np.array([[7, 8], [9, 10]], dtype=np.int32)
+            assert np.array_equal(runtime.get_var(process.u.id),
+                                  expected_result_u)
+
+    def test_get_set_var_larger_than_channel(self):
+        """Checks get_var() and set_var() for a Var with more items than
+        fit into a management channel at once."""
+        shape = (20, 15)
+        process = LargeProcess(shape=shape)
+        simple_sync_domain = SyncDomain("simple", LoihiProtocol(), [process])
+        run_config = SimpleRunConfig(sync_domains=[simple_sync_domain])
+        process.run(condition=RunSteps(num_steps=2), run_cfg=run_config)
+
+        expected_result_u = np.arange(300, dtype=np.int32).reshape(shape)
+        assert np.array_equal(process.u.get(), expected_result_u)
+        expected_result_u = expected_result_u[::-1] * 2
+        process.u.set(expected_result_u)
+        assert np.array_equal(process.u.get(), expected_result_u)
+        process.stop()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,11 @@
 import unittest
 
+import numpy as np
+
 from lava.magma.core.decorator import implements, requires
+from lava.magma.core.model.py.ports import PyInPort, PyOutPort
 from lava.magma.core.model.py.type import LavaPyType
+from lava.magma.core.process.ports.ports import InPort, OutPort
 from lava.magma.core.process.process import AbstractProcess
 from lava.magma.core.process.variable import Var
 from lava.magma.core.resources import CPU
@@ -20,6 +24,14 @@ class SimpleProcess(AbstractProcess):
         self.v = Var(shape=shape, init=0)
 
 
+class RingProcess(AbstractProcess):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.u = Var(shape=(2,), init=np.array([1, 2]))
+        self.inp = InPort(shape=(2,))
+        self.out = OutPort(shape=(2,))
+
+
 class SimpleRunConfig(RunConfig):
     def __init__(self, **kwargs):
         sync_domains = kwargs.pop("sync_domains")
@@ -52,6 +64,18 @@ class SimpleProcessModel(PyLoihiProcessModel):
         return False
 
 
+@implements(proc=RingProcess, protocol=LoihiProtocol)
+@requires(CPU)
+class RingProcessModel(PyLoihiProcessModel):
+    u = LavaPyType(np.ndarray, np.int32)
+    inp = LavaPyType(PyInPort.VEC_DENSE, np.int32)
+    out = LavaPyType(PyOutPort.VEC_DENSE, np.int32)
+
+    def run_spk(self):
+        self.out.send(self.u)
+        self.u += self.inp.recv()
+
+
 class TestProcess(unittest.TestCase):
     def test_synchronization_single_process_model(self):
         process = SimpleProcess(shape=(2, 2))
@@ -61,6 +85,23 @@ class TestProcess(unittest.TestCase):
         process.run(condition=RunSteps(num_steps=5), run_cfg=run_config)
         process.stop()
 
+    def test_synchronization_multiple_sync_domains(self):
+        """Checks that two ProcessModels coordinated by separate
+        RuntimeServices stay in lock step across runs."""
+        process_a = RingProcess()
+        process_b = RingProcess()
+        process_a.out.connect(process_b.inp)
+        process_b.out.connect(process_a.inp)
+        run_config = SimpleRunConfig(sync_domains=[
+            SyncDomain("a", LoihiProtocol(), [process_a]),
+            SyncDomain("b", LoihiProtocol(), [process_b])])
+        process_a.run(condition=RunSteps(num_steps=3), run_cfg=run_config)
+        process_a.run(condition=RunSteps(num_steps=2), run_cfg=run_config)
+        expected_u = np.array([32, 64])
+        self.assertTrue(np.array_equal(process_a.u.get(), expected_u))
+        self.assertTrue(np.array_equal(process_b.u.get(), expected_u))
+        process_a.stop()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -48,6 +48,27 @@ class TestRuntime(unittest.TestCase):
         with self.assertRaises(AssertionError):
             runtime4.initialize()
 
+    def test_runtime_context_manager(self):
+        """Tests that the runtime is initialized when used as a context
+        manager"""
+        exec: Executable = Executable()
+        node: Node = Node(HeadNode, [])
+        exec.node_configs.append(NodeConfig([node]))
+        with Runtime(exec, ActorType.MultiProcessing) as runtime:
+            self.assertTrue(runtime._is_initialized)
+            self.assertFalse(runtime._is_started)
+            actors = runtime._messaging_infrastructure.actors
+        # Leaving the context terminates all actors
+        self.assertFalse(any(actor.is_alive() for actor in actors))
+        self.assertFalse(runtime._is_initialized)
+
+    def test_auto_actor_type_selects_threads_for_small_workloads(self):
+        """Tests that ActorType.Auto resolves to threads for an executable
+        without any actors"""
+        runtime: Runtime = Runtime(Executable(), ActorType.Auto)
+        self.assertEqual(runtime._messaging_infrastructure_type,
+                         ActorType.MultiThreading)
+
 
 if __name__ == "__main__":
     unittest.main()